@@ -0,0 +1,276 @@
+"""Incremental bus timing analysis.
+
+:class:`BusTimingAnalyzer` ingests frames one at a time and keeps a fixed amount of
+state per arbitration ID (running period statistics plus P² quantile estimators for
+jitter), so memory does not grow with the number of frames in a window.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import cantools
+
+from .models import Frame
+from .resample import grid_steps
+
+DEFAULT_BITRATE = 500_000
+LATE_RATIO = 1.2
+MISSING_RATIO = 1.5
+
+
+def frame_bits(dlc: int, is_extended_id: bool = False) -> int:
+    """Worst-case bits on the wire for a classic CAN data frame, including stuff bits."""
+    payload = 8 * min(dlc, 8)
+    if is_extended_id:
+        return payload + 67 + (54 + payload - 1) // 4
+    return payload + 47 + (34 + payload - 1) // 4
+
+
+class P2Quantile:
+    """Streaming quantile estimate in O(1) memory (Jain & Chlamtac P² algorithm)."""
+
+    def __init__(self, q: float):
+        self.q = q
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._pos = [1, 2, 3, 4, 5]
+        self._desired = [1.0, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5.0]
+        self._step = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        if len(self._initial) < 5:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._heights = sorted(self._initial)
+            return
+        h = self._heights
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if h[i] <= x < h[i + 1])
+        for i in range(k + 1, 5):
+            self._pos[i] += 1
+        for i in range(5):
+            self._desired[i] += self._step[i]
+        for i in range(1, 4):
+            d = self._desired[i] - self._pos[i]
+            if (d >= 1 and self._pos[i + 1] - self._pos[i] > 1) or (
+                d <= -1 and self._pos[i - 1] - self._pos[i] < -1
+            ):
+                sign = 1 if d > 0 else -1
+                candidate = self._parabolic(i, sign)
+                if not h[i - 1] < candidate < h[i + 1]:
+                    candidate = h[i] + sign * (h[i + sign] - h[i]) / (
+                        self._pos[i + sign] - self._pos[i]
+                    )
+                h[i] = candidate
+                self._pos[i] += sign
+
+    def _parabolic(self, i: int, sign: int) -> float:
+        h, n = self._heights, self._pos
+        return h[i] + sign / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + sign) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - sign) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        if self._heights:
+            return self._heights[2]
+        if not self._initial:
+            return None
+        ordered = sorted(self._initial)
+        return ordered[min(len(ordered) - 1, int(math.ceil(self.q * len(ordered))) - 1)]
+
+
+class IdTimingStats:
+    """Per-arbitration-ID timing counters for one analysis window."""
+
+    __slots__ = (
+        "count",
+        "last_ts",
+        "periods",
+        "period_mean",
+        "period_m2",
+        "period_min",
+        "period_max",
+        "jitter",
+        "late",
+        "missing",
+        "dlc_mismatch",
+    )
+
+    def __init__(self, last_ts: Optional[float] = None):
+        self.count = 0
+        self.last_ts = last_ts
+        self.periods = 0
+        self.period_mean = 0.0
+        self.period_m2 = 0.0
+        self.period_min = math.inf
+        self.period_max = 0.0
+        self.jitter = {q: P2Quantile(q / 100.0) for q in (50, 95, 99)}
+        self.late = 0
+        self.missing = 0
+        self.dlc_mismatch = 0
+
+    def add_period(self, period: float, expected: Optional[float]) -> None:
+        self.periods += 1
+        delta = period - self.period_mean
+        self.period_mean += delta / self.periods
+        self.period_m2 += delta * (period - self.period_mean)
+        self.period_min = min(self.period_min, period)
+        self.period_max = max(self.period_max, period)
+        # Without a DBC cycle time, jitter is measured against the running mean period.
+        reference = expected if expected else self.period_mean
+        for est in self.jitter.values():
+            est.add(abs(period - reference))
+        if expected:
+            ratio = period / expected
+            if ratio >= MISSING_RATIO:
+                self.missing += int(ratio - 0.5)
+            elif ratio > LATE_RATIO:
+                self.late += 1
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000.0, 3)
+
+
+class BusTimingAnalyzer:
+    """Accumulate per-ID period, jitter, gap and DLC statistics plus overall bus load.
+
+    Expected periods come from the DBC ``cycle_time`` (``GenMsgCycleTime``) unless
+    overridden via ``expected_periods`` (seconds, keyed by arbitration ID).
+    """
+
+    def __init__(
+        self,
+        db: cantools.database.Database,
+        bitrate: int = DEFAULT_BITRATE,
+        expected_periods: Optional[Dict[int, float]] = None,
+    ):
+        self.db = db
+        self.bitrate = bitrate
+        self._messages = {m.frame_id: m for m in db.messages}
+        self.expected: Dict[int, float] = {
+            m.frame_id: m.cycle_time / 1000.0 for m in db.messages if m.cycle_time
+        }
+        self.expected.update(expected_periods or {})
+        self._stats: Dict[int, IdTimingStats] = {}
+        self._window_start: Optional[float] = None
+        self._last_frame_ts: Optional[float] = None
+        self._frames = 0
+        self._bits = 0
+
+    def ingest(self, frame: Frame) -> None:
+        ts = frame.timestamp
+        if self._window_start is None:
+            self._window_start = ts
+        self._last_frame_ts = ts
+        self._frames += 1
+        dlc = len(frame.data)
+        self._bits += frame_bits(dlc, frame.is_extended_id)
+
+        stats = self._stats.get(frame.arbitration_id)
+        if stats is None:
+            stats = self._stats[frame.arbitration_id] = IdTimingStats()
+        stats.count += 1
+        message = self._messages.get(frame.arbitration_id)
+        if message is not None and dlc != message.length:
+            stats.dlc_mismatch += 1
+        if stats.last_ts is not None and ts > stats.last_ts:
+            stats.add_period(ts - stats.last_ts, self.expected.get(frame.arbitration_id))
+        stats.last_ts = ts
+
+    def report(self, window_end: Optional[float] = None) -> Dict[str, Any]:
+        """Summarize the current window; ``window_end`` defaults to the last frame time."""
+        start = self._window_start
+        end = window_end if window_end is not None else self._last_frame_ts
+        duration = (end - start) if start is not None and end is not None else 0.0
+        ids: Dict[str, Any] = {}
+        seen = sorted(i for i, s in self._stats.items() if s.count)
+        for arb_id in seen:
+            s = self._stats[arb_id]
+            message = self._messages.get(arb_id)
+            expected = self.expected.get(arb_id)
+            entry: Dict[str, Any] = {
+                "name": message.name if message is not None else None,
+                "count": s.count,
+                "expected_period_ms": _ms(expected),
+            }
+            if s.periods:
+                std = math.sqrt(s.period_m2 / s.periods)
+                entry["period_ms"] = {
+                    "mean": _ms(s.period_mean),
+                    "std": _ms(std),
+                    "min": _ms(s.period_min),
+                    "max": _ms(s.period_max),
+                }
+                entry["jitter_ms"] = {f"p{q}": _ms(est.value()) for q, est in s.jitter.items()}
+            if expected:
+                entry["late"] = s.late
+                entry["missing"] = s.missing
+            if s.dlc_mismatch:
+                entry["dlc_mismatch"] = s.dlc_mismatch
+            ids[hex(arb_id)] = entry
+        silent = [hex(arb_id) for arb_id in sorted(self.expected) if arb_id not in seen]
+        load = self._bits / (duration * self.bitrate) * 100.0 if duration > 0 else None
+        return {
+            "window": {
+                "start": start,
+                "end": end,
+                "duration_s": round(duration, 6),
+                "frames": self._frames,
+                "bitrate": self.bitrate,
+                "bus_load_pct": round(load, 3) if load is not None else None,
+            },
+            "unknown_ids": [hex(i) for i in seen if i not in self._messages],
+            "silent_ids": silent,
+            "ids": ids,
+        }
+
+    def reset(self, window_start: Optional[float] = None) -> None:
+        """Start a new window; last-seen times carry over so gaps span windows."""
+        self._stats = {
+            arb_id: IdTimingStats(last_ts=s.last_ts) for arb_id, s in self._stats.items()
+        }
+        self._window_start = window_start
+        self._frames = 0
+        self._bits = 0
+
+
+def analyze_windows(
+    analyzer: BusTimingAnalyzer,
+    frames: Iterable[Frame],
+    start: float,
+    end: float,
+    window_s: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Feed ``frames`` through ``analyzer`` and return one report per window.
+
+    Without ``window_s`` the whole ``[start, end)`` span is a single window.
+    """
+    reports: List[Dict[str, Any]] = []
+    span = end - start
+    step = window_s if window_s and window_s > 0 else span
+    # Edges are start + k * step rather than a running sum, so epoch-sized timestamps do
+    # not accumulate float error; a rounding-sized remainder is folded into the last window.
+    count = max(1, grid_steps(start, end, step)) if step > 0 else 1
+    edges = [start + k * step for k in range(1, count)] + [end]
+    index = 0
+    analyzer.reset(window_start=start)
+    for frame in frames:
+        while index < count - 1 and frame.timestamp >= edges[index]:
+            reports.append(analyzer.report(edges[index]))
+            analyzer.reset(window_start=edges[index])
+            index += 1
+        analyzer.ingest(frame)
+    while index < count - 1:
+        reports.append(analyzer.report(edges[index]))
+        analyzer.reset(window_start=edges[index])
+        index += 1
+    reports.append(analyzer.report(end))
+    return reports
@@ -0,0 +1,311 @@
+"""Offline benchmark suite for the decode, bus, simulator and MCP tool paths.
+
+Every benchmark runs on the python-can ``virtual`` backend on a private channel, so
+no hardware or running simulator is needed. Results are a flat mapping of metric
+name to ``{"value", "unit", "higher_is_better", "noise_floor"}`` which can be written
+to JSON and compared against a stored baseline with :func:`compare_results`.
+"""
+
+import asyncio
+import json
+import platform
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import can
+import cantools
+import pydantic_core
+
+from . import __version__
+from .bus import make_bus, read_frames, shutdown_bus
+from .config import Settings
+from .dbc import decode_frame, load_dbc
+from .simulator.profiles import DEFAULT_PROFILE
+from .simulator.runner import start_sim_threads
+
+BENCH_INTERFACE = "virtual"
+BENCH_CHANNEL = "mcp-can-bench"
+
+Results = Dict[str, Dict[str, Any]]
+
+
+def _metric(
+    value: float,
+    unit: str,
+    higher_is_better: bool,
+    noise_floor: float = 0.0,
+) -> Dict[str, Any]:
+    """Build a result entry; changes smaller than ``noise_floor`` never count as regressions."""
+    return {
+        "value": round(value, 4),
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+        "noise_floor": noise_floor,
+    }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+def _sample_payload(msg: cantools.database.can.Message) -> bytes:
+    signals = {sig.name: sig.offset for sig in msg.signals}
+    return msg.encode(signals)
+
+
+def bench_decode(
+    db: cantools.database.Database,
+    iterations: int = 20000,
+    repeats: int = 3,
+) -> Results:
+    """Measure ``decode_frame`` throughput for every message in the DBC (best of N)."""
+    results: Results = {}
+    for msg in db.messages:
+        data = _sample_payload(msg)
+        frame_id = msg.frame_id
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                decode_frame(db, frame_id, data)
+            best = min(best, time.perf_counter() - start)
+        results[f"decode.{msg.name}.frames_per_s"] = _metric(
+            iterations / best, "frames/s", True, 20_000.0
+        )
+    return results
+
+
+def bench_read_frames(duration_s: float = 1.0) -> Results:
+    """Measure ``read_frames`` receive throughput and send-to-receive latency."""
+    tx = make_bus(BENCH_INTERFACE, BENCH_CHANNEL)
+    rx = make_bus(BENCH_INTERFACE, BENCH_CHANNEL)
+    stop = threading.Event()
+    msg = can.Message(arbitration_id=0x100, data=bytes(8), is_extended_id=False)
+
+    def _blast() -> None:
+        while not stop.is_set():
+            tx.send(msg)
+
+    sender = threading.Thread(target=_blast, daemon=True)
+    try:
+        sender.start()
+        start = time.perf_counter()
+        frames = read_frames(rx, duration_s)
+        elapsed = time.perf_counter() - start
+        stop.set()
+        sender.join(timeout=1.0)
+        # Latency probe on an idle channel so queueing from the blast does not dominate.
+        while rx.recv(timeout=0) is not None:
+            pass
+        delays: List[float] = []
+        for _ in range(200):
+            tx.send(msg)
+            got = rx.recv(timeout=0.5)
+            if got is not None:
+                delays.append((time.time() - got.timestamp) * 1000.0)
+    finally:
+        stop.set()
+        shutdown_bus(tx)
+        shutdown_bus(rx)
+    return {
+        "bus.read_frames.frames_per_s": _metric(
+            len(frames) / elapsed, "frames/s", True, 5_000.0
+        ),
+        "bus.delivery_ms_p50": _metric(percentile(delays, 50), "ms", False, 0.5),
+        "bus.delivery_ms_p99": _metric(percentile(delays, 99), "ms", False, 1.0),
+    }
+
+
+def bench_simulator(db: cantools.database.Database, duration_s: float = 2.0) -> Results:
+    """Measure the simulator's achieved rate and period jitter per profiled message."""
+    tx = make_bus(BENCH_INTERFACE, BENCH_CHANNEL)
+    rx = make_bus(BENCH_INTERFACE, BENCH_CHANNEL)
+    stop = threading.Event()
+    try:
+        start_sim_threads(db, tx, DEFAULT_PROFILE, stop)
+        frames = read_frames(rx, duration_s)
+    finally:
+        stop.set()
+        shutdown_bus(tx)
+        shutdown_bus(rx)
+
+    stamps: Dict[int, List[float]] = {}
+    for f in frames:
+        stamps.setdefault(f.arbitration_id, []).append(f.timestamp)
+
+    results: Results = {}
+    for msg_name, period in DEFAULT_PROFILE:
+        ts = stamps.get(db.get_message_by_name(msg_name).frame_id, [])
+        intervals = [b - a for a, b in zip(ts, ts[1:])]
+        if not intervals:
+            continue
+        rate = len(intervals) / (ts[-1] - ts[0])
+        jitter = [abs(i - period) * 1000.0 for i in intervals]
+        results[f"simulator.{msg_name}.rate_error_pct"] = _metric(
+            abs(rate * period - 1.0) * 100.0, "%", False, 1.0
+        )
+        results[f"simulator.{msg_name}.jitter_ms_p95"] = _metric(
+            percentile(jitter, 95), "ms", False, 2.0
+        )
+    return results
+
+
+def bench_monitor_signal(
+    dbc_path: str,
+    window_s: float = 0.5,
+    rounds: int = 4,
+    signal_name: str = "ENGINE_SPEED",
+    send_period_s: float = 0.001,
+) -> Results:
+    """Measure end-to-end latency from a frame's send to the ``monitor_signal`` result.
+
+    A dedicated sender transmits the signal's message every ``send_period_s`` (1 ms), so
+    the newest sample in a result was sent just before the window closed.
+    ``send_to_result_ms`` is the time from that sample's send (the virtual backend stamps
+    frames at send time) to the call returning; ``overhead_ms`` is the call's wall time
+    beyond the requested window.
+    """
+    from .server.fastmcp_server import create_app
+
+    settings = Settings(
+        can_interface=BENCH_INTERFACE, can_channel=BENCH_CHANNEL, dbc_path=dbc_path
+    )
+    mcp = create_app(settings)
+    db = load_dbc(dbc_path)
+    message = next(m for m in db.messages if any(s.name == signal_name for s in m.signals))
+    msg = can.Message(
+        arbitration_id=message.frame_id,
+        data=_sample_payload(message),
+        is_extended_id=message.is_extended_frame,
+    )
+    tx = make_bus(BENCH_INTERFACE, BENCH_CHANNEL)
+    overheads: List[float] = []
+    latencies: List[float] = []
+
+    async def _run() -> None:
+        for _ in range(rounds):
+            start = time.time()
+            contents = await mcp.call_tool(
+                "monitor_signal", {"signal_name": signal_name, "duration_s": window_s}
+            )
+            done = time.time()
+            overheads.append((done - start - window_s) * 1000.0)
+            samples = [json.loads(c.text) for c in contents if hasattr(c, "text")]
+            if samples:
+                latencies.append((done - samples[-1]["timestamp"]) * 1000.0)
+
+    task = tx.send_periodic(msg, send_period_s)
+    try:
+        asyncio.run(_run())
+    finally:
+        task.stop()
+        shutdown_bus(tx)
+    return {
+        "monitor_signal.overhead_ms_p50": _metric(percentile(overheads, 50), "ms", False, 20.0),
+        "monitor_signal.send_to_result_ms_p50": _metric(
+            percentile(latencies, 50), "ms", False, 2.0
+        ),
+        "monitor_signal.send_to_result_ms_max": _metric(
+            max(latencies, default=0.0), "ms", False, 5.0
+        ),
+    }
+
+
+def bench_json(frame_count: int = 2000, iterations: int = 5) -> Results:
+    """Measure serialization cost of a ``read_can_frames``-shaped tool response.
+
+    FastMCP converts list results item by item with ``pydantic_core.to_json``; the
+    stdlib ``json.dumps`` of the whole list is measured alongside for comparison.
+    """
+    now = time.time()
+    payload = [
+        {
+            "timestamp": now + i * 0.001,
+            "arbitration_id": hex(0x100 + (i % 4) * 0x100),
+            "data": list(range(8)),
+        }
+        for i in range(frame_count)
+    ]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for item in payload:
+            pydantic_core.to_json(item, fallback=str, indent=2)
+    fastmcp_us = (time.perf_counter() - start) / (iterations * frame_count) * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        json.dumps(payload)
+    stdlib_us = (time.perf_counter() - start) / (iterations * frame_count) * 1e6
+    return {
+        "json.fastmcp_to_json.us_per_frame": _metric(fastmcp_us, "us", False, 0.5),
+        "json.stdlib_dumps.us_per_frame": _metric(stdlib_us, "us", False, 0.5),
+    }
+
+
+def run_benchmarks(dbc_path: str, quick: bool = False) -> Dict[str, Any]:
+    """Run the whole suite and return ``{"meta": ..., "results": ...}``."""
+    db = load_dbc(dbc_path)
+    scale = 0.25 if quick else 1.0
+    results: Results = {}
+    results.update(bench_decode(db, iterations=int(20000 * scale)))
+    results.update(bench_read_frames(duration_s=1.0 * scale))
+    results.update(bench_simulator(db, duration_s=max(1.0, 4.0 * scale)))
+    results.update(bench_monitor_signal(dbc_path, rounds=2 if quick else 4))
+    results.update(bench_json(iterations=2 if quick else 5))
+    return {
+        "meta": {
+            "mcp_can_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    current: Results,
+    baseline: Results,
+    tolerance: float = 0.3,
+) -> List[Dict[str, Any]]:
+    """Return metrics that regressed by more than ``tolerance`` (relative) vs baseline.
+
+    A change must also exceed the baseline entry's ``noise_floor`` (absolute) to count.
+    Metrics missing from either side are ignored.
+    """
+    regressions: List[Dict[str, Any]] = []
+    for name, base in baseline.items():
+        cur = current.get(name)
+        if cur is None:
+            continue
+        base_value = float(base["value"])
+        cur_value = float(cur["value"])
+        if base_value == 0:
+            continue
+        change = (cur_value - base_value) / abs(base_value)
+        worse = -change if base.get("higher_is_better", False) else change
+        if worse > tolerance and abs(cur_value - base_value) > base.get("noise_floor", 0.0):
+            regressions.append(
+                {
+                    "metric": name,
+                    "baseline": base_value,
+                    "current": cur_value,
+                    "change_pct": round(change * 100.0, 1),
+                }
+            )
+    return regressions
+
+
+def load_report(path: str) -> Optional[Dict[str, Any]]:
+    """Load a ``{"meta": ..., "results": ...}`` benchmark JSON file, if it exists."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
@@ -1,5 +1,5 @@
 import time
-from typing import List
+from typing import Callable, Iterator, List, Optional
 
 import can
 
@@ -15,20 +15,32 @@ def make_bus(interface: str, channel: str) -> can.BusABC:
         return can.interface.Bus(interface=interface, channel=channel)  # type: ignore[arg-type]
 
 
-def read_frames(bus: can.BusABC, duration_s: float = 1.0) -> List[Frame]:
+def iter_frames(
+    bus: can.BusABC,
+    duration_s: float = 1.0,
+    on_idle: Optional[Callable[[], None]] = None,
+) -> Iterator[Frame]:
+    """Yield frames as they arrive until ``duration_s`` has elapsed (``math.inf`` = forever).
+
+    ``on_idle`` is called whenever a receive times out without a frame.
+    """
     end = time.time() + duration_s
-    frames: List[Frame] = []
     while time.time() < end:
         msg = bus.recv(timeout=0.1)
-        if msg:
-            frames.append(
-                Frame(
-                    timestamp=msg.timestamp,
-                    arbitration_id=msg.arbitration_id,
-                    data=bytes(msg.data),
-                )
-            )
-    return frames
+        if not msg:
+            if on_idle is not None:
+                on_idle()
+            continue
+        yield Frame(
+            timestamp=msg.timestamp,
+            arbitration_id=msg.arbitration_id,
+            data=bytes(msg.data),
+            is_extended_id=bool(getattr(msg, "is_extended_id", False)),
+        )
+
+
+def read_frames(bus: can.BusABC, duration_s: float = 1.0) -> List[Frame]:
+    return list(iter_frames(bus, duration_s))
 
 
 def shutdown_bus(bus: can.BusABC) -> None:
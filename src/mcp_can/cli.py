@@ -1,15 +1,22 @@
 import json
+import math
+import sys
 import threading
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 
-from .bus import make_bus, read_frames, shutdown_bus
+from .analysis import DEFAULT_BITRATE, BusTimingAnalyzer, analyze_windows
+from .bus import iter_frames, make_bus, shutdown_bus
 from .config import get_settings
 from .dbc import decode_frame, load_dbc
+from .models import Frame
+from .ndjson import NdjsonWriter
 from .obd import build_request
+from .resample import METHODS, resample_frames
 from .server.fastmcp_server import main as run_server
 from .simulator.runner import run_simulator
+from .transmit import PeriodicTransmitter, build_message, message_to_dict, send_batch
 
 app = typer.Typer(help="MCP-CAN: simulate, inspect and serve CAN data over MCP.")
 
@@ -31,24 +38,43 @@ def simulate() -> None:
     run_simulator()
 
 
+def _capture_duration(seconds: float) -> float:
+    return seconds if seconds > 0 else math.inf
+
+
+def _frame_dict(frame: Frame) -> Dict[str, Any]:
+    return {
+        "timestamp": frame.timestamp,
+        "arbitration_id": hex(frame.arbitration_id),
+        "data": list(frame.data),
+    }
+
+
 @app.command()
-def frames(seconds: float = typer.Option(1.0, help="Duration to listen on CAN bus")) -> None:
+def frames(
+    seconds: float = typer.Option(1.0, help="Duration to listen on CAN bus (0 = until Ctrl-C)"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON line per frame"),
+) -> None:
     """Capture raw CAN frames for a period and print JSON."""
     settings = get_settings()
     bus = make_bus(settings.can_interface, settings.can_channel)
+    writer = NdjsonWriter(sys.stdout) if ndjson else None
+    out: List[Dict[str, Any]] = []
     try:
-        frames_list = read_frames(bus, seconds)
-        out = [
-            {
-                "timestamp": f.timestamp,
-                "arbitration_id": hex(f.arbitration_id),
-                "data": list(f.data),
-            }
-            for f in frames_list
-        ]
-        typer.echo(json.dumps(out, indent=2))
+        on_idle = writer.tick if writer is not None else None
+        for frame in iter_frames(bus, _capture_duration(seconds), on_idle=on_idle):
+            if writer is not None:
+                writer.write(_frame_dict(frame))
+            else:
+                out.append(_frame_dict(frame))
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
     finally:
         shutdown_bus(bus)
+    if writer is not None:
+        _close_stream(writer)
+    else:
+        typer.echo(json.dumps(out, indent=2))
 
 
 @app.command()
@@ -79,26 +105,231 @@ def decode(id: str, data: str) -> None:
 
 
 @app.command()
-def monitor(signal: str, seconds: float = typer.Option(2.0, help="Duration to listen")) -> None:
+def monitor(
+    signal: str,
+    seconds: float = typer.Option(2.0, help="Duration to listen (0 = until Ctrl-C)"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON line per sample"),
+) -> None:
     """Monitor a specific signal and print timestamped values."""
     settings = get_settings()
     db = load_dbc(settings.dbc_path)
     bus = make_bus(settings.can_interface, settings.can_channel)
+    writer = NdjsonWriter(sys.stdout) if ndjson else None
+    out: List[Dict[str, Any]] = []
+    try:
+        on_idle = writer.tick if writer is not None else None
+        for frame in iter_frames(bus, _capture_duration(seconds), on_idle=on_idle):
+            try:
+                decoded = decode_frame(db, frame.arbitration_id, frame.data)
+            except Exception:
+                continue
+            if signal in decoded:
+                sample = {"timestamp": frame.timestamp, "value": decoded[signal]}
+                if writer is not None:
+                    writer.write(sample)
+                else:
+                    out.append(sample)
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        shutdown_bus(bus)
+    if writer is not None:
+        _close_stream(writer)
+    else:
+        typer.echo(json.dumps(out, indent=2, default=str))
+
+
+def _close_stream(writer: NdjsonWriter) -> None:
+    """Flush remaining lines; a closed downstream pipe (e.g. ``| head``) is not an error."""
+    try:
+        writer.flush()
+    except BrokenPipeError:
+        # Python flushes stdout again at exit; point it at devnull so that is silent too.
+        import os
+
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+@app.command()
+def resample(
+    signals: List[str] = typer.Argument(..., help="Signal names (MESSAGE.SIGNAL if ambiguous)"),
+    seconds: float = typer.Option(2.0, help="Duration to listen"),
+    interval: float = typer.Option(0.05, help="Grid spacing in seconds"),
+    method: str = typer.Option("zoh", help=f"Resampling method: {', '.join(METHODS)}"),
+) -> None:
+    """Monitor several signals and print them resampled onto one time grid as JSON columns."""
+    import time as _t
+
+    settings = get_settings()
+    db = load_dbc(settings.dbc_path)
+    bus = make_bus(settings.can_interface, settings.can_channel)
+    try:
+        start = _t.time()
+        try:
+            columns = resample_frames(
+                db, iter_frames(bus, seconds), signals, start, start + seconds, interval, method
+            )
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+        typer.echo(json.dumps(columns, indent=2))
+    finally:
+        shutdown_bus(bus)
+
+
+@app.command()
+def export(
+    out_dir: str = typer.Argument(..., help="Output directory"),
+    seconds: float = typer.Option(10.0, help="Capture duration (0 = until Ctrl-C)"),
+    fmt: str = typer.Option("parquet", "--format", help="parquet or arrow (Arrow IPC file)"),
+    row_group_size: int = typer.Option(10_000, help="Rows per row group / record batch"),
+    partition_by_message: bool = typer.Option(
+        False, help="Write decoded signals to signals/message=<NAME>/"
+    ),
+    decode: bool = typer.Option(True, help="Also write DBC-decoded signals"),
+) -> None:
+    """Capture frames to columnar files (needs pyarrow: pip install 'mcp-can[export]')."""
+    from .export import CaptureExporter
+
+    settings = get_settings()
+    db = load_dbc(settings.dbc_path) if decode else None
+    try:
+        exporter = CaptureExporter(
+            out_dir,
+            db=db,
+            fmt=fmt,
+            row_group_size=row_group_size,
+            partition_by_message=partition_by_message,
+        )
+    except (RuntimeError, ValueError) as e:
+        raise typer.BadParameter(str(e))
+    bus = make_bus(settings.can_interface, settings.can_channel)
+    try:
+        for frame in iter_frames(bus, _capture_duration(seconds)):
+            exporter.write(frame)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            summary = exporter.close()
+        finally:
+            shutdown_bus(bus)
+    typer.echo(json.dumps(summary, indent=2))
+
+
+@app.command()
+def timing(
+    seconds: float = typer.Option(5.0, help="Duration to listen"),
+    window: Optional[float] = typer.Option(None, help="Report every N seconds"),
+    bitrate: int = typer.Option(DEFAULT_BITRATE, help="Bus bitrate for load calculation"),
+) -> None:
+    """Analyze per-ID period, jitter, gaps, DLC mismatches and bus load; print JSON."""
     import time as _t
-    end = _t.time() + seconds
-    out: List[dict] = []
+
+    settings = get_settings()
+    db = load_dbc(settings.dbc_path)
+    bus = make_bus(settings.can_interface, settings.can_channel)
     try:
-        while _t.time() < end:
-            msg = bus.recv(timeout=0.1)
-            if msg:
-                try:
-                    decoded = decode_frame(db, msg.arbitration_id, msg.data)
-                    if signal in decoded:
-                        out.append({"timestamp": msg.timestamp, "value": decoded[signal]})
-                except Exception:
-                    pass
-        typer.echo(json.dumps(out, indent=2))
+        analyzer = BusTimingAnalyzer(db, bitrate=bitrate)
+        start = _t.time()
+        reports = analyze_windows(
+            analyzer, iter_frames(bus, seconds), start, start + seconds, window
+        )
+        typer.echo(json.dumps(reports, indent=2))
+    finally:
+        shutdown_bus(bus)
+
+
+def _parse_signals(signals: str) -> dict:
+    try:
+        parsed = json.loads(signals)
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"signals must be a JSON object: {e}")
+    if not isinstance(parsed, dict):
+        raise typer.BadParameter("signals must be a JSON object")
+    return parsed
+
+
+@app.command()
+def send(
+    message: str = typer.Argument(..., help="DBC message name or ID (e.g. ENGINE_STATUS, 0x100)"),
+    signals: str = typer.Option("{}", help='Signal values as JSON, e.g. {"ENGINE_SPEED": 1500}'),
+) -> None:
+    """Encode one message through the DBC, send it and print the frame as JSON."""
+    settings = get_settings()
+    db = load_dbc(settings.dbc_path)
+    bus = make_bus(settings.can_interface, settings.can_channel)
+    try:
+        try:
+            msg = build_message(db, message, _parse_signals(signals))
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+        bus.send(msg)
+        typer.echo(json.dumps(message_to_dict(msg), indent=2))
+    finally:
+        shutdown_bus(bus)
+
+
+@app.command("send-batch")
+def send_batch_cmd(
+    path: str = typer.Argument(
+        ..., help='JSON file ("-" for stdin): [{"message": ..., "signals": {...}}, ...]'
+    ),
+) -> None:
+    """Encode and send a batch of messages in order and print the frames as JSON."""
+    import sys
+
+    settings = get_settings()
+    db = load_dbc(settings.dbc_path)
+    try:
+        if path == "-":
+            frames_spec = json.load(sys.stdin)
+        else:
+            with open(path, "r", encoding="utf-8") as fh:
+                frames_spec = json.load(fh)
+    except (OSError, json.JSONDecodeError) as e:
+        raise typer.BadParameter(f"cannot read batch JSON: {e}")
+    if not isinstance(frames_spec, list):
+        raise typer.BadParameter("batch JSON must be a list of frames")
+    bus = make_bus(settings.can_interface, settings.can_channel)
+    try:
+        try:
+            sent = send_batch(bus, db, frames_spec)
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+        typer.echo(json.dumps([message_to_dict(m) for m in sent], indent=2))
+    finally:
+        shutdown_bus(bus)
+
+
+@app.command("send-periodic")
+def send_periodic(
+    message: str = typer.Argument(..., help="DBC message name or ID"),
+    signals: str = typer.Option("{}", help="Signal values as JSON"),
+    period: float = typer.Option(0.1, help="Transmit period in seconds"),
+    seconds: float = typer.Option(0.0, help="How long to transmit (0 = until Ctrl-C)"),
+) -> None:
+    """Transmit a message cyclically via python-can send_periodic (BCM on SocketCAN)."""
+    import time as _t
+
+    settings = get_settings()
+    db = load_dbc(settings.dbc_path)
+    bus = make_bus(settings.can_interface, settings.can_channel)
+    transmitter = PeriodicTransmitter(bus, db)
+    try:
+        try:
+            entry = transmitter.start(
+                message, _parse_signals(signals), period, seconds if seconds > 0 else None
+            )
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+        typer.echo(json.dumps(entry.to_dict(), indent=2))
+        try:
+            while entry.active:
+                _t.sleep(0.1)
+        except KeyboardInterrupt:
+            pass
     finally:
+        transmitter.close()
         shutdown_bus(bus)
 
 
@@ -133,6 +364,77 @@ def obd_request(
         shutdown_bus(bus)
 
 
+@app.command()
+def bench(
+    output: Optional[str] = typer.Option(None, help="Write results JSON to this path"),
+    baseline: Optional[str] = typer.Option(
+        None, help="Baseline results JSON to compare against (e.g. benchmarks/baseline.json)"
+    ),
+    tolerance: float = typer.Option(0.3, help="Allowed relative regression before failing"),
+    quick: bool = typer.Option(False, help="Shorter runs for smoke testing"),
+) -> None:
+    """Run the offline benchmark suite on the virtual backend and print JSON.
+
+    Exits with code 1 if any metric regressed beyond the tolerance vs the baseline.
+    The baseline must exist and have been recorded with the same ``--quick`` setting.
+    """
+    from .bench import compare_results, load_report, run_benchmarks
+
+    settings = get_settings()
+    base = None
+    if baseline is not None:
+        base = load_report(baseline)
+        if base is None:
+            raise typer.BadParameter(f"Baseline not found: {baseline}", param_hint="--baseline")
+        base_quick = bool(base.get("meta", {}).get("quick"))
+        if base_quick != quick:
+            raise typer.BadParameter(
+                f"Baseline {baseline} has quick={base_quick} but this run has quick={quick}; "
+                "compare against a baseline recorded with the same --quick setting",
+                param_hint="--baseline",
+            )
+    report = run_benchmarks(settings.dbc_path, quick=quick)
+    if base is not None:
+        report["regressions"] = compare_results(report["results"], base["results"], tolerance)
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    typer.echo(json.dumps(report, indent=2))
+    if report.get("regressions"):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def loadtest(
+    clients: str = typer.Option("1,4,16", help="Comma-separated concurrency levels"),
+    calls: int = typer.Option(10, help="Calls per client at each level"),
+    mix: str = typer.Option(
+        "read_can_frames=1,monitor_signal=1,decode_can_frame=2,dbc_info=1",
+        help="Weighted call mix (name=weight,...)",
+    ),
+    call_seconds: float = typer.Option(0.2, help="duration_s passed to bus-reading tools"),
+    seed: int = typer.Option(0, help="Random seed for the call mix"),
+) -> None:
+    """Load-test an in-process SSE MCP server with concurrent clients and print JSON."""
+    from .loadtest import parse_mix, run_load_test
+
+    settings = get_settings()
+    try:
+        levels = [int(c) for c in clients.split(",") if c.strip()]
+        weights = parse_mix(mix)
+    except ValueError as e:
+        raise typer.BadParameter(str(e))
+    report = run_load_test(
+        settings.dbc_path,
+        levels,
+        calls_per_client=calls,
+        mix=weights,
+        call_duration_s=call_seconds,
+        seed=seed,
+    )
+    typer.echo(json.dumps(report, indent=2))
+
+
 @app.command("demo")
 def demo(
     port: Optional[int] = typer.Option(
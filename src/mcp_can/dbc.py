@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Tuple, Union
 
 import cantools
 
@@ -13,7 +13,46 @@ def decode_frame(
     db: cantools.database.Database,
     arbitration_id: int,
     data: bytes,
+    decode_choices: bool = True,
 ) -> Dict[str, Any]:
     message = db.get_message_by_frame_id(arbitration_id)
-    return message.decode(data)
+    return message.decode(data, decode_choices=decode_choices)
 
+
+def get_message(
+    db: cantools.database.Database,
+    ref: Union[str, int],
+) -> cantools.database.can.Message:
+    """Look up a message by name, frame ID, or ID string (hex like 0x100 or decimal)."""
+    if isinstance(ref, int):
+        return db.get_message_by_frame_id(ref)
+    text = ref.strip()
+    if text.lower().startswith("0x"):
+        return db.get_message_by_frame_id(int(text, 16))
+    if text.isdigit():
+        return db.get_message_by_frame_id(int(text))
+    return db.get_message_by_name(text)
+
+
+def encode_frame(
+    db: cantools.database.Database,
+    ref: Union[str, int],
+    signals: Mapping[str, Any],
+) -> Tuple[cantools.database.can.Message, bytes]:
+    """Encode physical signal values for a message.
+
+    Signals not given fall back to the DBC initial value, or to raw zero.
+    """
+    message = get_message(db, ref)
+    values: Dict[str, Any] = {}
+    for sig in message.signals:
+        if sig.name in signals:
+            values[sig.name] = signals[sig.name]
+        elif sig.initial is not None:
+            values[sig.name] = sig.initial
+        else:
+            values[sig.name] = sig.offset
+    unknown = set(signals) - set(values)
+    if unknown:
+        raise ValueError(f"Unknown signal(s) for {message.name}: {sorted(unknown)}")
+    return message, message.encode(values)
@@ -0,0 +1,192 @@
+"""Columnar export of captured frames and decoded signals (Parquet or Arrow IPC).
+
+Rows are buffered per output file and written as one row group / record batch every
+``row_group_size`` rows, so memory stays bounded however long the capture runs.
+Requires the optional ``pyarrow`` dependency (``pip install mcp-can[export]``).
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import cantools
+
+from .dbc import decode_frame
+from .models import Frame
+
+FORMATS = ("parquet", "arrow")
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise RuntimeError(
+            "Export requires pyarrow; install it with: pip install 'mcp-can[export]'"
+        ) from None
+    return pyarrow
+
+
+def frame_schema(pa: Any) -> Any:
+    return pa.schema(
+        [
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+            ("arbitration_id", pa.uint32()),
+            ("is_extended_id", pa.bool_()),
+            ("dlc", pa.uint8()),
+            ("data", pa.binary()),
+        ]
+    )
+
+
+def signal_schema(pa: Any, with_message: bool = True) -> Any:
+    fields = [
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("arbitration_id", pa.uint32()),
+    ]
+    if with_message:
+        fields.append(("message", pa.dictionary(pa.int32(), pa.string())))
+    fields += [
+        ("signal", pa.dictionary(pa.int32(), pa.string())),
+        ("value", pa.float64()),
+        ("label", pa.string()),
+    ]
+    return pa.schema(fields)
+
+
+class _ColumnarSink:
+    """Buffers rows for one file and writes them in row groups / record batches."""
+
+    def __init__(self, pa: Any, path: str, schema: Any, fmt: str, row_group_size: int):
+        self.pa = pa
+        self.path = path
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._buffer: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(path, schema)
+        else:
+            self._writer = pa.ipc.new_file(path, schema)
+        self._parquet = fmt == "parquet"
+
+    def append(self, row: Dict[str, Any]) -> None:
+        values = [row[name] for name in self._buffer]
+        for column, value in zip(self._buffer.values(), values):
+            column.append(value)
+        if len(self._buffer["timestamp"]) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        # A Ctrl-C between the per-column appends leaves a partial last row; drop it so
+        # the columns line up and the file can still be finalized.
+        count = min(len(column) for column in self._buffer.values())
+        for column in self._buffer.values():
+            del column[count:]
+        if not count:
+            return
+        batch = self.pa.RecordBatch.from_pydict(self._buffer, schema=self.schema)
+        if self._parquet:
+            self._writer.write_table(self.pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self.rows += count
+        for column in self._buffer.values():
+            column.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+
+class CaptureExporter:
+    """Stream frames (and optionally decoded signals) into columnar files under ``out_dir``.
+
+    Layout: ``frames.<ext>`` for raw frames and ``signals.<ext>`` for decoded signals in
+    long format; with ``partition_by_message`` signals go to
+    ``signals/message=<NAME>/part-0.<ext>`` (hive-style, readable as one dataset).
+    """
+
+    def __init__(
+        self,
+        out_dir: str,
+        db: Optional[cantools.database.Database] = None,
+        fmt: str = "parquet",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        partition_by_message: bool = False,
+    ):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}'; expected one of {FORMATS}")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+        self.pa = _require_pyarrow()
+        self.out_dir = out_dir
+        self.db = db
+        self.fmt = fmt
+        self.ext = "parquet" if fmt == "parquet" else "arrow"
+        self.row_group_size = row_group_size
+        self.partition_by_message = partition_by_message
+        self._frames = self._sink("frames", frame_schema(self.pa))
+        self._signals: Dict[str, _ColumnarSink] = {}
+
+    def _sink(self, relative: str, schema: Any) -> _ColumnarSink:
+        path = os.path.join(self.out_dir, f"{relative}.{self.ext}")
+        return _ColumnarSink(self.pa, path, schema, self.fmt, self.row_group_size)
+
+    def _signal_sink(self, message_name: str) -> _ColumnarSink:
+        key = message_name if self.partition_by_message else ""
+        sink = self._signals.get(key)
+        if sink is None:
+            if self.partition_by_message:
+                relative = os.path.join("signals", f"message={message_name}", "part-0")
+                sink = self._sink(relative, signal_schema(self.pa, with_message=False))
+            else:
+                sink = self._sink("signals", signal_schema(self.pa))
+            self._signals[key] = sink
+        return sink
+
+    def write(self, frame: Frame) -> None:
+        ts_us = int(round(frame.timestamp * 1_000_000))
+        self._frames.append(
+            {
+                "timestamp": ts_us,
+                "arbitration_id": frame.arbitration_id,
+                "is_extended_id": frame.is_extended_id,
+                "dlc": len(frame.data),
+                "data": bytes(frame.data),
+            }
+        )
+        if self.db is None:
+            return
+        try:
+            message = self.db.get_message_by_frame_id(frame.arbitration_id)
+            decoded = decode_frame(self.db, frame.arbitration_id, frame.data)
+        except Exception:
+            return
+        sink = self._signal_sink(message.name)
+        for name, value in decoded.items():
+            label = getattr(value, "name", None)
+            numeric = getattr(value, "value", value)
+            sink.append(
+                {
+                    "timestamp": ts_us,
+                    "arbitration_id": frame.arbitration_id,
+                    "message": message.name,
+                    "signal": name,
+                    "value": float(numeric),
+                    "label": label,
+                }
+            )
+
+    def close(self) -> Dict[str, Any]:
+        """Flush and close every file; return paths and row counts."""
+        sinks = [self._frames, *self._signals.values()]
+        for sink in sinks:
+            sink.close()
+        return {
+            "format": self.fmt,
+            "files": [{"path": s.path, "rows": s.rows} for s in sinks],
+        }
@@ -0,0 +1,275 @@
+"""Concurrent-client load test for the SSE MCP server.
+
+Starts ``create_app()`` in-process behind uvicorn together with the ECU simulator on a
+private virtual channel, then opens N concurrent SSE MCP sessions that issue a weighted
+mix of tool calls. Latency percentiles, error rate and server thread CPU / process
+memory are reported for each concurrency level.
+"""
+
+import asyncio
+import logging
+import random
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import uvicorn
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from pydantic import AnyUrl
+
+from .bench import percentile
+from .bus import make_bus, shutdown_bus
+from .config import Settings
+from .dbc import load_dbc
+from .simulator.profiles import DEFAULT_PROFILE
+from .simulator.runner import start_sim_threads
+
+try:  # not available on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+LOAD_INTERFACE = "virtual"
+LOAD_CHANNEL = "mcp-can-load"
+
+DEFAULT_MIX: Dict[str, float] = {
+    "read_can_frames": 1.0,
+    "monitor_signal": 1.0,
+    "decode_can_frame": 2.0,
+    "dbc_info": 1.0,
+}
+
+DBC_RESOURCE_URI = "file://vehicle.dbc"
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse ``"read_can_frames=1,decode_can_frame=4"`` into a weight mapping."""
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown call '{name}'; expected one of {sorted(DEFAULT_MIX)}")
+        mix[name] = float(weight) if weight.strip() else 1.0
+        if mix[name] < 0:
+            raise ValueError(f"Weight for '{name}' must not be negative")
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Call mix must contain at least one positive weight")
+    return mix
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _thread_cpu_time(thread: threading.Thread) -> Optional[float]:
+    """CPU seconds consumed by ``thread`` (POSIX only), else None."""
+    getter = getattr(time, "pthread_getcpuclockid", None)
+    if getter is None or thread.ident is None:
+        return None
+    try:
+        return time.clock_gettime(getter(thread.ident))
+    except OSError:
+        return None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return round(rss / 1024.0 if rss < 1 << 32 else rss / (1024.0 * 1024.0), 1)
+
+
+class _ServerThread(threading.Thread):
+    def __init__(self, app: Any, port: int):
+        super().__init__(daemon=True)
+        config = uvicorn.Config(
+            app,
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            timeout_graceful_shutdown=1,
+        )
+        self.server = uvicorn.Server(config)
+
+    def run(self) -> None:
+        self.server.run()
+
+    def stop(self) -> None:
+        # The SSE transport does not notice client disconnects, so lingering session
+        # tasks are cancelled at shutdown; their tracebacks are expected noise here.
+        logging.getLogger("uvicorn.error").setLevel(logging.CRITICAL)
+        self.server.should_exit = True
+        self.join(timeout=5.0)
+
+
+async def _call(session: ClientSession, name: str, call_duration_s: float) -> bool:
+    """Issue one call; return True on success."""
+    if name == "dbc_info":
+        await session.read_resource(AnyUrl(DBC_RESOURCE_URI))
+        return True
+    if name == "read_can_frames":
+        args: Dict[str, Any] = {"duration_s": call_duration_s}
+    elif name == "monitor_signal":
+        args = {"signal_name": "ENGINE_SPEED", "duration_s": call_duration_s}
+    else:
+        args = {"arbitration_id": 0x100, "data": [0x10, 0x27, 0x78, 0x32, 0x4B, 0x64, 0, 0]}
+    result = await session.call_tool(name, args)
+    return not result.isError
+
+
+async def _client(
+    url: str,
+    calls: int,
+    mix: Dict[str, float],
+    call_duration_s: float,
+    rng: random.Random,
+    samples: List[Tuple[str, float, bool]],
+) -> None:
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    try:
+        async with sse_client(url) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                for _ in range(calls):
+                    name = rng.choices(names, weights)[0]
+                    start = time.perf_counter()
+                    try:
+                        ok = await _call(session, name, call_duration_s)
+                    except Exception:
+                        ok = False
+                    samples.append((name, (time.perf_counter() - start) * 1000.0, ok))
+    except Exception:
+        # Connection or session failure: every remaining call counts as an error.
+        samples.extend(("connect", 0.0, False) for _ in range(calls - len(samples)))
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "p50": round(percentile(latencies, 50), 2),
+        "p95": round(percentile(latencies, 95), 2),
+        "p99": round(percentile(latencies, 99), 2),
+    }
+
+
+def _run_level(
+    url: str,
+    clients: int,
+    calls_per_client: int,
+    mix: Dict[str, float],
+    call_duration_s: float,
+    server_thread: threading.Thread,
+    seed: int,
+) -> Dict[str, Any]:
+    per_client: List[List[Tuple[str, float, bool]]] = [[] for _ in range(clients)]
+
+    async def _main() -> None:
+        await asyncio.gather(
+            *(
+                _client(
+                    url,
+                    calls_per_client,
+                    mix,
+                    call_duration_s,
+                    random.Random(seed + i),
+                    per_client[i],
+                )
+                for i in range(clients)
+            )
+        )
+
+    cpu_start = _thread_cpu_time(server_thread)
+    wall_start = time.perf_counter()
+    asyncio.run(_main())
+    wall = time.perf_counter() - wall_start
+    cpu_end = _thread_cpu_time(server_thread)
+
+    samples = [s for client_samples in per_client for s in client_samples]
+    ok_latencies = [lat for _, lat, ok in samples if ok]
+    errors = sum(1 for _, _, ok in samples if not ok)
+    by_tool: Dict[str, Dict[str, Any]] = {}
+    for name in sorted({n for n, _, _ in samples}):
+        lat = [la for n, la, ok in samples if n == name and ok]
+        by_tool[name] = {
+            "calls": sum(1 for n, _, _ in samples if n == name),
+            "latency_ms": _latency_summary(lat),
+        }
+    server_cpu_pct: Optional[float] = None
+    if cpu_start is not None and cpu_end is not None and wall > 0:
+        server_cpu_pct = round((cpu_end - cpu_start) / wall * 100.0, 1)
+    return {
+        "clients": clients,
+        "calls": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "wall_s": round(wall, 3),
+        "throughput_calls_per_s": round(len(samples) / wall, 2) if wall > 0 else 0.0,
+        "latency_ms": _latency_summary(ok_latencies),
+        "by_tool": by_tool,
+        "server_cpu_pct": server_cpu_pct,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_load_test(
+    dbc_path: str,
+    concurrency: List[int],
+    calls_per_client: int = 10,
+    mix: Optional[Dict[str, float]] = None,
+    call_duration_s: float = 0.2,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Run the load test at each concurrency level and return a JSON-able report.
+
+    ``server_cpu_pct`` is CPU time of the uvicorn thread (which runs every tool call)
+    over wall time; ``peak_rss_mb`` is the whole process, clients included.
+    """
+    from .server.fastmcp_server import create_app
+
+    mix = mix or dict(DEFAULT_MIX)
+    # Per-request logging would dominate the measurement at higher concurrency; the
+    # server-side INFO lines also run on the uvicorn thread whose CPU time is reported.
+    for name in ("httpx", "mcp.client.sse", "mcp.server"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    settings = Settings(
+        can_interface=LOAD_INTERFACE, can_channel=LOAD_CHANNEL, dbc_path=dbc_path
+    )
+    mcp = create_app(settings)
+    port = _free_port()
+    server_thread = _ServerThread(mcp.sse_app(), port)
+    sim_bus = make_bus(LOAD_INTERFACE, LOAD_CHANNEL)
+    stop = threading.Event()
+    levels: List[Dict[str, Any]] = []
+    try:
+        start_sim_threads(load_dbc(dbc_path), sim_bus, DEFAULT_PROFILE, stop)
+        server_thread.start()
+        deadline = time.time() + 10.0
+        while not server_thread.server.started and time.time() < deadline:
+            time.sleep(0.05)
+        if not server_thread.server.started:
+            raise RuntimeError("MCP server did not start within 10 s")
+        url = f"http://127.0.0.1:{port}/sse"
+        for clients in concurrency:
+            levels.append(
+                _run_level(
+                    url, clients, calls_per_client, mix, call_duration_s, server_thread, seed
+                )
+            )
+    finally:
+        stop.set()
+        server_thread.stop()
+        shutdown_bus(sim_bus)
+    return {
+        "calls_per_client": calls_per_client,
+        "call_duration_s": call_duration_s,
+        "mix": mix,
+        "levels": levels,
+    }
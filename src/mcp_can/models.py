@@ -7,6 +7,7 @@ class Frame:
     timestamp: float
     arbitration_id: int
     data: bytes
+    is_extended_id: bool = False
 
 
 @dataclass
@@ -0,0 +1,40 @@
+"""Buffered newline-delimited JSON output for streaming CLI captures."""
+
+import json
+import time
+from typing import Any, List, TextIO
+
+
+class NdjsonWriter:
+    """Write one compact JSON object per line, flushing in batches.
+
+    Lines are buffered and written with a single ``write`` once ``buffer_lines`` have
+    accumulated or ``flush_interval`` seconds have passed, so a busy bus does not cost
+    a syscall per frame while a quiet one still shows up promptly. Call :meth:`tick`
+    while idle so the last lines are not held back.
+    """
+
+    def __init__(self, stream: TextIO, flush_interval: float = 0.2, buffer_lines: int = 512):
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.buffer_lines = buffer_lines
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, obj: Any) -> None:
+        self._lines.append(json.dumps(obj, separators=(",", ":"), default=str))
+        if len(self._lines) >= self.buffer_lines:
+            self.flush()
+        else:
+            self.tick()
+
+    def tick(self) -> None:
+        if self._lines and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        self.stream.flush()
+        self._last_flush = time.monotonic()
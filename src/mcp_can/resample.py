@@ -0,0 +1,185 @@
+"""Time-aligned resampling of several signals onto one common grid.
+
+:class:`SignalResampler` receives samples as frames are decoded and fills each signal's
+column up to the newest sample, so work per sample is proportional to the grid points
+it covers and finished rows can be drained while a capture is still running.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import cantools
+
+from .dbc import decode_frame
+from .models import Frame
+
+METHODS = ("zoh", "linear", "nearest")
+MAX_GRID_ROWS = 100_000
+
+
+def grid_steps(start: float, end: float, step: float) -> int:
+    """Number of grid points ``start + k * step`` strictly before ``end``.
+
+    ``end - start`` of epoch timestamps carries rounding error of a few ulps of the
+    timestamps themselves (~1e-7 s), so points that close to ``end`` count as ``end``.
+    """
+    slack = 4 * math.ulp(max(abs(start), abs(end))) + 1e-9 * step
+    return max(0, math.ceil((end - start - slack) / step))
+
+
+def resolve_signals(
+    db: cantools.database.Database,
+    names: Sequence[str],
+) -> Dict[int, List[Tuple[str, str]]]:
+    """Map frame IDs to ``(column, signal)`` pairs for the requested signal names.
+
+    Names may be plain (``ENGINE_SPEED``) or qualified (``ENGINE_STATUS.ENGINE_SPEED``);
+    plain names must be unique across the DBC.
+    """
+    by_signal: Dict[str, List[cantools.database.can.Message]] = {}
+    for msg in db.messages:
+        for sig in msg.signals:
+            by_signal.setdefault(sig.name, []).append(msg)
+    index: Dict[int, List[Tuple[str, str]]] = {}
+    for name in names:
+        msg_name, _, sig_name = name.rpartition(".")
+        candidates = by_signal.get(sig_name, [])
+        if msg_name:
+            candidates = [m for m in candidates if m.name == msg_name]
+        if not candidates:
+            raise ValueError(f"Unknown signal '{name}'")
+        if len(candidates) > 1:
+            options = ", ".join(f"{m.name}.{sig_name}" for m in candidates)
+            raise ValueError(f"Signal '{name}' is ambiguous; use one of: {options}")
+        index.setdefault(candidates[0].frame_id, []).append((name, sig_name))
+    return index
+
+
+class _Column:
+    __slots__ = ("values", "prev")
+
+    def __init__(self) -> None:
+        self.values: List[Optional[float]] = []
+        self.prev: Optional[Tuple[float, float]] = None
+
+
+class SignalResampler:
+    """Resample signals onto ``start + k * interval_s`` with zoh, linear or nearest.
+
+    Grid points before a signal's first sample are ``None`` (``nearest`` uses the first
+    sample); points after its last sample hold the last value. Samples per signal must
+    arrive in time order, as they do when read from a bus.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        start: float,
+        interval_s: float,
+        method: str = "zoh",
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'; expected one of {METHODS}")
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        self.start = start
+        self.interval_s = interval_s
+        self.method = method
+        self._columns: Dict[str, _Column] = {name: _Column() for name in columns}
+        self._offset = 0  # grid index of the first row not yet drained
+
+    def _grid_index(self, ts: float) -> int:
+        """Number of grid points strictly before ``ts``."""
+        return grid_steps(self.start, ts, self.interval_s)
+
+    def add(self, column: str, ts: float, value: float) -> None:
+        col = self._columns[column]
+        stop = self._grid_index(ts)
+        first = self._offset + len(col.values)
+        if stop > first:
+            col.values.extend(self._fill(col.prev, first, stop, ts, value))
+        col.prev = (ts, value)
+
+    def _fill(
+        self,
+        prev: Optional[Tuple[float, float]],
+        first: int,
+        stop: int,
+        ts: float,
+        value: float,
+    ) -> List[Optional[float]]:
+        if prev is None:
+            fill = value if self.method == "nearest" else None
+            return [fill] * (stop - first)
+        t0, v0 = prev
+        if self.method == "zoh":
+            return [v0] * (stop - first)
+        start, step = self.start, self.interval_s
+        if self.method == "linear":
+            slope = (value - v0) / (ts - t0) if ts > t0 else 0.0
+            return [v0 + slope * (start + k * step - t0) for k in range(first, stop)]
+        midpoint = (t0 + ts) / 2.0
+        return [v0 if start + k * step < midpoint else value for k in range(first, stop)]
+
+    def _rows_ready(self) -> int:
+        return min((len(c.values) for c in self._columns.values()), default=0)
+
+    def drain(self) -> Dict[str, List[Any]]:
+        """Remove and return rows that every column has already filled."""
+        n = self._rows_ready()
+        table: Dict[str, List[Any]] = {"timestamp": self._timestamps(self._offset, n)}
+        for name, col in self._columns.items():
+            table[name] = col.values[:n]
+            del col.values[:n]
+        self._offset += n
+        return table
+
+    def finish(self, end: float) -> Dict[str, List[Any]]:
+        """Fill every column up to ``end`` (exclusive) and return the remaining rows."""
+        stop = self._grid_index(end)
+        for col in self._columns.values():
+            first = self._offset + len(col.values)
+            if stop > first:
+                hold = col.prev[1] if col.prev is not None else None
+                col.values.extend([hold] * (stop - first))
+        return self.drain()
+
+    def _timestamps(self, first: int, count: int) -> List[float]:
+        return [round(self.start + k * self.interval_s, 6) for k in range(first, first + count)]
+
+
+def resample_frames(
+    db: cantools.database.Database,
+    frames: Iterable[Frame],
+    names: Sequence[str],
+    start: float,
+    end: float,
+    interval_s: float,
+    method: str = "zoh",
+) -> Dict[str, List[Any]]:
+    """Decode only the frames carrying ``names`` and return one columnar table.
+
+    Choice signals are resampled as their raw numeric values. Grids longer than
+    ``MAX_GRID_ROWS`` are rejected before any frame is read.
+    """
+    names = list(dict.fromkeys(names))
+    index = resolve_signals(db, names)
+    resampler = SignalResampler(names, start, interval_s, method)
+    rows = grid_steps(start, end, interval_s)
+    if rows > MAX_GRID_ROWS:
+        raise ValueError(
+            f"Grid of {rows} rows exceeds the limit of {MAX_GRID_ROWS}; "
+            "increase interval_s or shorten the duration"
+        )
+    for frame in frames:
+        wanted = index.get(frame.arbitration_id)
+        if not wanted:
+            continue
+        try:
+            decoded = decode_frame(db, frame.arbitration_id, frame.data, decode_choices=False)
+        except Exception:
+            continue
+        for column, signal in wanted:
+            if signal in decoded:
+                resampler.add(column, frame.timestamp, decoded[signal])
+    return resampler.finish(end)
@@ -2,21 +2,33 @@ import time
 import types
 from typing import Any, Dict, List, Optional
 
+import anyio
 from mcp.server.fastmcp import Context, FastMCP
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from ..bus import make_bus, shutdown_bus
-from ..config import get_settings
+from ..analysis import DEFAULT_BITRATE, BusTimingAnalyzer, analyze_windows
+from ..bus import iter_frames, make_bus, shutdown_bus
+from ..config import Settings, get_settings
 from ..dbc import decode_frame, load_dbc
+from ..resample import resample_frames
+from ..transmit import PeriodicTransmitter, message_to_dict, send_batch
 
 
-def create_app() -> FastMCP:
+def create_app(settings: Optional[Settings] = None) -> FastMCP:
     """Create a FastMCP server exposing CAN tools and DBC metadata."""
-    settings = get_settings()
+    settings = settings or get_settings()
     mcp = FastMCP("Vehicle CAN MCP")
     db = load_dbc(settings.dbc_path)
+    # Periodic tasks must outlive a single tool call, so transmit tools share one bus.
+    transmitter: List[PeriodicTransmitter] = []
+
+    def _transmitter() -> PeriodicTransmitter:
+        if not transmitter:
+            bus = make_bus(settings.can_interface, settings.can_channel)
+            transmitter.append(PeriodicTransmitter(bus, db))
+        return transmitter[0]
 
     @mcp.tool()
     async def read_can_frames(
@@ -124,6 +136,125 @@ def create_app() -> FastMCP:
         finally:
             shutdown_bus(bus)
 
+    @mcp.tool()
+    async def monitor_signals(
+        signal_names: List[str],
+        duration_s: float = 2.0,
+        interval_s: float = 0.05,
+        method: str = "zoh",
+    ) -> Dict[str, Any]:
+        """Monitor several signals in one pass, resampled onto a common time grid.
+
+        method: "zoh" (zero-order hold), "linear" or "nearest". Returns columns
+        {"timestamp": [...], "<signal>": [...]}; use MESSAGE.SIGNAL for ambiguous names.
+        """
+
+        def _capture() -> Dict[str, List[Any]]:
+            bus = make_bus(settings.can_interface, settings.can_channel)
+            try:
+                start = time.time()
+                return resample_frames(
+                    db,
+                    iter_frames(bus, duration_s),
+                    signal_names,
+                    start,
+                    start + duration_s,
+                    interval_s,
+                    method,
+                )
+            finally:
+                shutdown_bus(bus)
+
+        try:
+            columns = await anyio.to_thread.run_sync(_capture)
+            return {
+                "status": "success",
+                "method": method,
+                "interval_s": interval_s,
+                "columns": columns,
+            }
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    async def analyze_bus_timing(
+        duration_s: float = 2.0,
+        window_s: Optional[float] = None,
+        bitrate: int = DEFAULT_BITRATE,
+    ) -> Dict[str, Any]:
+        """Per-ID period, jitter, late/missing frames, DLC mismatches and bus load.
+
+        Periods are checked against the DBC cycle_time. Returns one report per
+        window_s (or a single report for the whole duration).
+        """
+
+        def _capture() -> List[Dict[str, Any]]:
+            bus = make_bus(settings.can_interface, settings.can_channel)
+            try:
+                analyzer = BusTimingAnalyzer(db, bitrate=bitrate)
+                start = time.time()
+                return analyze_windows(
+                    analyzer, iter_frames(bus, duration_s), start, start + duration_s, window_s
+                )
+            finally:
+                shutdown_bus(bus)
+
+        try:
+            # The capture blocks for duration_s; keep it off the event loop.
+            windows = await anyio.to_thread.run_sync(_capture)
+            return {"status": "success", "windows": windows}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    def send_can_frames(frames: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Encode and send frames in one call.
+
+        frames: [{"message": "ENGINE_STATUS" or "0x100", "signals": {"ENGINE_SPEED": 1500}}]
+        Signals left out use the DBC initial value (or raw zero).
+        """
+        try:
+            sent = send_batch(_transmitter().bus, db, frames)
+            return {"status": "success", "sent": [message_to_dict(m) for m in sent]}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    def start_periodic_transmission(
+        message: str,
+        signals: Dict[str, Any],
+        period_s: float,
+        duration_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Start cyclic transmission of an encoded message; returns a task_id handle."""
+        try:
+            entry = _transmitter().start(message, signals, period_s, duration_s)
+            return {"status": "success", **entry.to_dict()}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    def modify_periodic_transmission(task_id: int, signals: Dict[str, Any]) -> Dict[str, Any]:
+        """Change signal values of a running periodic transmission without restarting it."""
+        try:
+            entry = _transmitter().modify(task_id, signals)
+            return {"status": "success", **entry.to_dict()}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    def stop_periodic_transmission(task_id: int) -> Dict[str, Any]:
+        try:
+            entry = _transmitter().stop(task_id)
+            return {"status": "success", **entry.to_dict()}
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    def list_periodic_transmissions() -> Dict[str, Any]:
+        tasks = [entry.to_dict() for entry in transmitter[0].tasks()] if transmitter else []
+        return {"status": "success", "tasks": tasks}
+
     @mcp.resource("file://vehicle.dbc")
     def dbc_info() -> Dict[str, Any]:
         info: Dict[str, Any] = {}
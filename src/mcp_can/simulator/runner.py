@@ -1,7 +1,7 @@
 import random
 import threading
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import can
 import cantools
@@ -19,12 +19,14 @@ class SimThread(threading.Thread):
         msg_name: str,
         period: float,
         bus: can.BusABC,
+        stop_event: Optional[threading.Event] = None,
     ):
         super().__init__(daemon=True)
         self.db = db
         self.msg = db.get_message_by_name(msg_name)
         self.period = period
         self.bus = bus
+        self.stop_event = stop_event or threading.Event()
 
     def _random_signal_value(self, sig: cantools.database.can.signal.Signal):
         if sig.choices:
@@ -41,7 +43,7 @@ class SimThread(threading.Thread):
         return raw * sig.scale + sig.offset if sig.scale else raw
 
     def run(self):
-        while True:
+        while not self.stop_event.is_set():
             try:
                 signals = {sig.name: self._random_signal_value(sig) for sig in self.msg.signals}
                 data = self.msg.encode(signals)
@@ -54,7 +56,22 @@ class SimThread(threading.Thread):
                 # print(f"Sent {self.msg.name}: {signals}")
             except Exception as e:
                 print(f"Error sending {self.msg.name}: {e}")
-            time.sleep(self.period)
+            self.stop_event.wait(self.period)
+
+
+def start_sim_threads(
+    db: cantools.database.Database,
+    bus: can.BusABC,
+    profile: List[Tuple[str, float]] = DEFAULT_PROFILE,
+    stop_event: Optional[threading.Event] = None,
+) -> List[SimThread]:
+    """Start one SimThread per profile entry; set ``stop_event`` to stop them all."""
+    threads: List[SimThread] = []
+    for msg_name, period in profile:
+        t = SimThread(db, msg_name, period, bus, stop_event)
+        threads.append(t)
+        t.start()
+    return threads
 
 
 def run_simulator(profile: List[Tuple[str, float]] = DEFAULT_PROFILE) -> None:
@@ -84,11 +101,7 @@ def run_simulator(profile: List[Tuple[str, float]] = DEFAULT_PROFILE) -> None:
                             self.bus.send(resp)
                         except Exception as e:
                             print(f"OBD responder error: {e}")
-    threads: List[SimThread] = []
-    for msg_name, period in profile:
-        t = SimThread(db, msg_name, period, bus)
-        threads.append(t)
-        t.start()
+    start_sim_threads(db, bus, profile)
     obd_t = OBDResponderThread(bus)
     obd_t.start()
     print("ECU simulation running. Press Ctrl-C to exit.")
@@ -0,0 +1,200 @@
+"""DBC-encoded frame transmission: one-shot batches and managed periodic tasks.
+
+Periodic transmissions use python-can's ``send_periodic``, which maps to the kernel
+broadcast manager (BCM) on SocketCAN and to a single timer thread per task elsewhere,
+so cyclic stimulus does not need a Python loop per frame.
+"""
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import can
+import cantools
+
+from .dbc import encode_frame, get_message
+
+MessageRef = Union[str, int]
+
+
+def build_message(
+    db: cantools.database.Database,
+    ref: MessageRef,
+    signals: Mapping[str, Any],
+) -> can.Message:
+    """Encode ``signals`` through the DBC into a ready-to-send ``can.Message``.
+
+    Unknown messages or signals and values the DBC cannot encode raise ``ValueError``.
+    """
+    try:
+        message = get_message(db, ref)
+    except (KeyError, ValueError):
+        raise ValueError(f"Unknown message {ref!r}") from None
+    try:
+        _, data = encode_frame(db, message.frame_id, signals)
+    except KeyError:
+        # cantools raises a bare KeyError for e.g. a string that is not a choice label.
+        raise ValueError(f"Cannot encode {message.name}: invalid signal value") from None
+    except cantools.database.EncodeError as e:
+        raise ValueError(f"Cannot encode {message.name}: {e}") from None
+    return can.Message(
+        arbitration_id=message.frame_id,
+        data=data,
+        is_extended_id=message.is_extended_frame,
+    )
+
+
+def message_to_dict(msg: can.Message) -> Dict[str, Any]:
+    return {"arbitration_id": hex(msg.arbitration_id), "data": list(msg.data)}
+
+
+def send_batch(
+    bus: can.BusABC,
+    db: cantools.database.Database,
+    frames: Sequence[Mapping[str, Any]],
+) -> List[can.Message]:
+    """Encode and send ``[{"message": ..., "signals": {...}}, ...]`` in order.
+
+    All frames are encoded before the first one is sent, so an encoding error
+    (``ValueError`` naming the offending entry) transmits nothing.
+    """
+    messages: List[can.Message] = []
+    for i, f in enumerate(frames):
+        if not isinstance(f, Mapping) or "message" not in f:
+            raise ValueError(f'frames[{i}]: expected {{"message": ..., "signals": {{...}}}}')
+        signals = f.get("signals") or {}
+        if not isinstance(signals, Mapping):
+            raise ValueError(f"frames[{i}]: signals must be an object")
+        try:
+            messages.append(build_message(db, f["message"], signals))
+        except ValueError as e:
+            raise ValueError(f"frames[{i}]: {e}") from None
+    for msg in messages:
+        bus.send(msg)
+    return messages
+
+
+@dataclass
+class PeriodicTransmission:
+    task_id: int
+    message_name: str
+    signals: Dict[str, Any]
+    period_s: float
+    duration_s: Optional[float]
+    task: can.broadcastmanager.CyclicSendTaskABC
+    started_at: float = field(default_factory=time.time)
+    stopped: bool = False
+
+    @property
+    def active(self) -> bool:
+        if self.stopped:
+            return False
+        if self.duration_s is not None:
+            return time.time() < self.started_at + self.duration_s
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "message": self.message_name,
+            "signals": dict(self.signals),
+            "period_s": self.period_s,
+            "duration_s": self.duration_s,
+            "started_at": self.started_at,
+            "active": self.active,
+        }
+
+
+class PeriodicTransmitter:
+    """Owns a bus and the periodic send tasks started on it, addressed by task ID.
+
+    The bus is only used for sending; a listener-less ``can.Notifier`` keeps reading
+    it so received traffic is discarded instead of queueing up (the virtual backend's
+    receive queue is unbounded). Stopped and expired tasks are dropped from the table.
+    """
+
+    def __init__(self, bus: can.BusABC, db: cantools.database.Database):
+        self.bus = bus
+        self.db = db
+        self._tasks: Dict[int, PeriodicTransmission] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._drain = can.Notifier(bus, [], timeout=0.1)
+
+    def _prune(self) -> None:
+        with self._lock:
+            expired = [e for e in self._tasks.values() if not e.active]
+            for entry in expired:
+                del self._tasks[entry.task_id]
+        for entry in expired:
+            if not entry.stopped:
+                entry.task.stop()
+                entry.stopped = True
+
+    def start(
+        self,
+        ref: MessageRef,
+        signals: Mapping[str, Any],
+        period_s: float,
+        duration_s: Optional[float] = None,
+    ) -> PeriodicTransmission:
+        if period_s <= 0:
+            raise ValueError("period_s must be positive")
+        msg = build_message(self.db, ref, signals)
+        self._prune()
+        task = self.bus.send_periodic(msg, period_s, duration=duration_s)
+        with self._lock:
+            entry = PeriodicTransmission(
+                task_id=next(self._ids),
+                message_name=self.db.get_message_by_frame_id(msg.arbitration_id).name,
+                signals=dict(signals),
+                period_s=period_s,
+                duration_s=duration_s,
+                task=task,
+            )
+            self._tasks[entry.task_id] = entry
+        return entry
+
+    def get(self, task_id: int) -> PeriodicTransmission:
+        self._prune()
+        with self._lock:
+            entry = self._tasks.get(task_id)
+        if entry is None:
+            raise ValueError(f"No periodic transmission with task_id {task_id}")
+        return entry
+
+    def modify(self, task_id: int, signals: Mapping[str, Any]) -> PeriodicTransmission:
+        """Update some signals of a running task; other signals keep their values."""
+        entry = self.get(task_id)
+        if not entry.active:
+            raise ValueError(f"Periodic transmission {task_id} is not active")
+        if not isinstance(entry.task, can.broadcastmanager.ModifiableCyclicTaskABC):
+            raise ValueError(f"Periodic transmission {task_id} cannot be modified")
+        merged = {**entry.signals, **signals}
+        entry.task.modify_data(build_message(self.db, entry.message_name, merged))
+        entry.signals = merged
+        return entry
+
+    def stop(self, task_id: int) -> PeriodicTransmission:
+        entry = self.get(task_id)
+        entry.task.stop()
+        entry.stopped = True
+        with self._lock:
+            self._tasks.pop(task_id, None)
+        return entry
+
+    def tasks(self) -> List[PeriodicTransmission]:
+        self._prune()
+        with self._lock:
+            return list(self._tasks.values())
+
+    def stop_all(self) -> None:
+        for entry in self.tasks():
+            self.stop(entry.task_id)
+
+    def close(self) -> None:
+        """Stop every task and the receive drain; the bus itself is left to the caller."""
+        self.stop_all()
+        self._drain.stop()
@@ -0,0 +1,75 @@
+import os
+import random
+
+from mcp_can.analysis import BusTimingAnalyzer, P2Quantile, analyze_windows, frame_bits
+from mcp_can.dbc import load_dbc
+from mcp_can.models import Frame
+
+DBC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "vehicle.dbc"))
+
+
+def test_p2_quantile_tracks_sorted_percentile():
+    rng = random.Random(1)
+    values = [rng.gauss(0, 1) for _ in range(5000)]
+    est = P2Quantile(0.95)
+    for v in values:
+        est.add(v)
+    exact = sorted(values)[int(0.95 * len(values))]
+    assert abs(est.value() - exact) < 0.1
+
+
+def test_analyzer_reports_period_gaps_dlc_and_unknown_ids():
+    db = load_dbc(DBC_PATH)  # ENGINE_STATUS (0x100) has a 50 ms cycle time
+    analyzer = BusTimingAnalyzer(db, bitrate=500_000)
+    stamps = [0.0, 0.05, 0.10, 0.17, 0.35, 0.40]  # 0.17 is late, 3 frames missing before 0.35
+    for ts in stamps:
+        analyzer.ingest(Frame(timestamp=ts, arbitration_id=0x100, data=bytes(8)))
+    analyzer.ingest(Frame(timestamp=0.2, arbitration_id=0x300, data=bytes(8)))  # DLC 4 in DBC
+    analyzer.ingest(Frame(timestamp=0.3, arbitration_id=0x123, data=bytes(2)))
+
+    report = analyzer.report(window_end=0.4)
+    engine = report["ids"]["0x100"]
+    assert engine["count"] == 6
+    assert engine["expected_period_ms"] == 50.0
+    assert engine["late"] == 1
+    assert engine["missing"] == 3
+    assert engine["period_ms"]["max"] == 180.0
+    assert report["ids"]["0x300"]["dlc_mismatch"] == 1
+    assert report["unknown_ids"] == ["0x123"]
+    assert "0x200" in report["silent_ids"]
+    bits = 7 * frame_bits(8) + frame_bits(2)
+    assert report["window"]["bus_load_pct"] == round(bits / (0.4 * 500_000) * 100, 3)
+
+
+def test_analyze_windows_splits_and_carries_gaps_across_windows():
+    db = load_dbc(DBC_PATH)
+    frames = [Frame(timestamp=i * 0.05, arbitration_id=0x100, data=bytes(8)) for i in range(20)]
+    reports = analyze_windows(BusTimingAnalyzer(db), frames, 0.0, 1.0, window_s=0.5)
+    assert len(reports) == 2
+    assert [r["ids"]["0x100"]["count"] for r in reports] == [10, 10]
+    # The first frame of the second window still yields a period from the previous one.
+    assert reports[1]["ids"]["0x100"]["period_ms"]["min"] == 50.0
+
+
+def test_analyze_windows_edges_stay_exact_with_epoch_timestamps():
+    db = load_dbc(DBC_PATH)
+    start = 1_760_000_000.123
+    end = start + 1.0
+    frames = [
+        Frame(timestamp=start + i * 0.05, arbitration_id=0x100, data=bytes(8)) for i in range(20)
+    ]
+    reports = analyze_windows(BusTimingAnalyzer(db), frames, start, end, window_s=0.1)
+    assert len(reports) == 10
+    assert reports[-1]["window"]["end"] == end
+    assert all(abs(r["window"]["duration_s"] - 0.1) < 1e-6 for r in reports)
+    assert all(r["window"]["bus_load_pct"] < 100 for r in reports)
+
+
+def test_analyze_windows_has_no_sliver_window_for_random_epoch_starts():
+    db = load_dbc(DBC_PATH)
+    rng = random.Random(3)
+    for _ in range(200):
+        start = 1_792_378_812.0 + rng.random() * 1000.0
+        reports = analyze_windows(BusTimingAnalyzer(db), [], start, start + 0.2, window_s=0.05)
+        assert len(reports) == 4
+        assert all(r["window"]["duration_s"] > 0.049 for r in reports)
@@ -0,0 +1,50 @@
+import os
+
+from mcp_can.bench import bench_decode, bench_json, compare_results
+from mcp_can.dbc import load_dbc
+
+DBC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "vehicle.dbc"))
+
+
+def _entry(value: float, higher_is_better: bool, noise_floor: float = 0.0) -> dict:
+    return {
+        "value": value,
+        "unit": "x",
+        "higher_is_better": higher_is_better,
+        "noise_floor": noise_floor,
+    }
+
+
+def test_compare_results_flags_regressions_in_both_directions():
+    baseline = {
+        "decode.frames_per_s": _entry(1000.0, True),
+        "latency_ms": _entry(10.0, False),
+        "steady": _entry(5.0, False),
+    }
+    current = {
+        "decode.frames_per_s": _entry(500.0, True),  # throughput halved
+        "latency_ms": _entry(20.0, False),  # latency doubled
+        "steady": _entry(5.1, False),
+    }
+    regressed = {r["metric"] for r in compare_results(current, baseline, tolerance=0.3)}
+    assert regressed == {"decode.frames_per_s", "latency_ms"}
+
+
+def test_compare_results_respects_noise_floor_and_missing_metrics():
+    baseline = {"jitter_ms": _entry(0.1, False, noise_floor=1.0), "gone": _entry(1.0, True)}
+    current = {"jitter_ms": _entry(0.5, False)}
+    assert compare_results(current, baseline, tolerance=0.3) == []
+
+
+def test_bench_json_reports_both_serializers():
+    results = bench_json(frame_count=50, iterations=1)
+    assert set(results) == {
+        "json.fastmcp_to_json.us_per_frame",
+        "json.stdlib_dumps.us_per_frame",
+    }
+    assert all(r["value"] > 0 for r in results.values())
+
+
+def test_throughput_metrics_carry_a_noise_floor():
+    results = bench_decode(load_dbc(DBC_PATH), iterations=10, repeats=1)
+    assert results and all(r["noise_floor"] > 0 for r in results.values())
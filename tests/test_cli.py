@@ -64,3 +64,82 @@ def test_cli_obd_request_basic(monkeypatch):
     assert out["arbitration_id"] == hex(0x7E8)
     assert out["data"][0] == 3  # length
     assert out["data"][1] == 0x41 and out["data"][2] == 0x0D
+
+
+def test_cli_send_encodes_through_dbc(monkeypatch):
+    fake = FakeBus([])
+    monkeypatch.setattr(cli_module, "make_bus", lambda *a, **k: fake)
+
+    result = runner.invoke(
+        cli_module.app, ["send", "ENGINE_STATUS", "--signals", '{"ENGINE_SPEED": 1500}']
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(fake.sent) == 1
+    assert fake.sent[0].arbitration_id == 0x100
+    assert fake.sent[0].data[:2] == bytes([0xDC, 0x05])  # 1500 little-endian
+    assert json.loads(result.stdout)["arbitration_id"] == hex(0x100)
+
+
+def test_cli_send_and_send_batch_report_bad_input_as_usage_errors(monkeypatch):
+    fake = FakeBus([])
+    monkeypatch.setattr(cli_module, "make_bus", lambda *a, **k: fake)
+
+    unknown = runner.invoke(cli_module.app, ["send", "NOT_A_MESSAGE"])
+    assert unknown.exit_code == 2
+    assert "Unknown message" in unknown.output
+    for batch in ("not json", '{"message": "ENGINE_STATUS"}', '[{"signals": {}}]'):
+        result = runner.invoke(cli_module.app, ["send-batch", "-"], input=batch)
+        assert result.exit_code == 2, batch
+        assert not isinstance(result.exception, (KeyError, json.JSONDecodeError))
+    assert fake.sent == []
+
+
+def test_cli_frames_ndjson_streams_one_line_per_frame(monkeypatch):
+    fake = FakeBus(
+        [
+            FakeMsg(0x100, bytes([1, 2, 3, 4, 5, 6, 7, 8])),
+            FakeMsg(0x200, bytes([9, 9])),
+        ]
+    )
+    monkeypatch.setattr(cli_module, "make_bus", lambda *a, **k: fake)
+
+    result = runner.invoke(cli_module.app, ["frames", "--seconds", "0.05", "--ndjson"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.stdout.splitlines()
+    assert [json.loads(line)["arbitration_id"] for line in lines] == [hex(0x100), hex(0x200)]
+    assert " " not in lines[0]  # compact separators
+
+
+def test_cli_monitor_ndjson(monkeypatch):
+    # ENGINE_STATUS with ENGINE_SPEED = 1500 (0x05DC little-endian)
+    fake = FakeBus([FakeMsg(0x100, bytes([0xDC, 0x05, 0, 0, 0, 0, 0, 0]), timestamp=1.0)])
+    monkeypatch.setattr(cli_module, "make_bus", lambda *a, **k: fake)
+
+    result = runner.invoke(
+        cli_module.app, ["monitor", "ENGINE_SPEED", "--seconds", "0.05", "--ndjson"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout) == {"timestamp": 1.0, "value": 1500}
+
+
+def test_cli_bench_rejects_missing_or_mismatched_baseline(monkeypatch, tmp_path):
+    from mcp_can import bench as bench_module
+
+    calls = []
+    monkeypatch.setattr(
+        bench_module,
+        "run_benchmarks",
+        lambda *a, **k: calls.append(k) or {"meta": {}, "results": {}},
+    )
+    missing = runner.invoke(cli_module.app, ["bench", "--baseline", str(tmp_path / "none.json")])
+    assert missing.exit_code != 0
+
+    full = tmp_path / "full.json"
+    full.write_text(json.dumps({"meta": {"quick": False}, "results": {}}))
+    mismatch = runner.invoke(cli_module.app, ["bench", "--quick", "--baseline", str(full)])
+    assert mismatch.exit_code != 0
+    assert "quick" in mismatch.output
+    assert calls == []
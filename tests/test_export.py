@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from mcp_can.dbc import encode_frame, load_dbc
+from mcp_can.models import Frame
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+pds = pytest.importorskip("pyarrow.dataset")
+
+from mcp_can.export import CaptureExporter  # noqa: E402
+
+DBC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "vehicle.dbc"))
+
+
+def _frames(db):
+    out = []
+    for i in range(5):
+        _, data = encode_frame(db, "ENGINE_STATUS", {"ENGINE_SPEED": 1000 + i})
+        out.append(Frame(timestamp=1_700_000_000 + i * 0.05, arbitration_id=0x100, data=data))
+    _, data = encode_frame(db, "BODY_STATUS", {"WIPER_STATUS": "LOW_SPEED"})
+    out.append(Frame(timestamp=1_700_000_001.0, arbitration_id=0x400, data=data))
+    out.append(Frame(timestamp=1_700_000_001.1, arbitration_id=0x7FF, data=b"\x01"))
+    return out
+
+
+def test_parquet_export_types_row_groups_and_signals(tmp_path):
+    db = load_dbc(DBC_PATH)
+    exporter = CaptureExporter(str(tmp_path), db=db, row_group_size=2)
+    for frame in _frames(db):
+        exporter.write(frame)
+    summary = exporter.close()
+
+    frames = pq.ParquetFile(tmp_path / "frames.parquet")
+    assert frames.metadata.num_rows == 7
+    assert frames.metadata.num_row_groups == 4
+    schema = frames.schema_arrow
+    assert schema.field("arbitration_id").type == pa.uint32()
+    assert schema.field("timestamp").type == pa.timestamp("us", tz="UTC")
+
+    signals = pq.read_table(tmp_path / "signals.parquet").to_pylist()
+    speeds = [r["value"] for r in signals if r["signal"] == "ENGINE_SPEED"]
+    assert speeds == [1000.0, 1001.0, 1002.0, 1003.0, 1004.0]
+    wiper = next(r for r in signals if r["signal"] == "WIPER_STATUS")
+    assert wiper["value"] == 4.0 and wiper["label"] == "LOW_SPEED"
+    assert {f["rows"] for f in summary["files"]} == {7, len(signals)}
+
+
+def test_arrow_export_partitioned_by_message(tmp_path):
+    db = load_dbc(DBC_PATH)
+    exporter = CaptureExporter(str(tmp_path), db=db, fmt="arrow", partition_by_message=True)
+    for frame in _frames(db):
+        exporter.write(frame)
+    exporter.close()
+
+    with pa.ipc.open_file(tmp_path / "frames.arrow") as reader:
+        assert reader.read_all().num_rows == 7
+    dataset = pds.dataset(tmp_path / "signals", format="arrow", partitioning="hive")
+    table = dataset.to_table()
+    assert set(table.column("message").to_pylist()) == {"ENGINE_STATUS", "BODY_STATUS"}
+
+
+def test_close_drops_row_left_partial_by_interrupt(tmp_path):
+    db = load_dbc(DBC_PATH)
+    exporter = CaptureExporter(str(tmp_path), db=None)
+    for frame in _frames(db)[:3]:
+        exporter.write(frame)
+    # As if Ctrl-C landed between the per-column appends of a fourth row.
+    exporter._frames._buffer["timestamp"].append(0)
+    exporter._frames._buffer["arbitration_id"].append(0x100)
+    summary = exporter.close()
+    assert summary["files"][0]["rows"] == 3
+    assert pq.read_table(tmp_path / "frames.parquet").num_rows == 3
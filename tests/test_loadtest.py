@@ -0,0 +1,18 @@
+import pytest
+
+from mcp_can.loadtest import DEFAULT_MIX, parse_mix
+
+
+def test_parse_mix_weights_and_defaults():
+    mix = parse_mix("read_can_frames=1, decode_can_frame=4,dbc_info")
+    assert mix == {"read_can_frames": 1.0, "decode_can_frame": 4.0, "dbc_info": 1.0}
+    assert set(mix).issubset(DEFAULT_MIX)
+
+
+def test_parse_mix_rejects_unknown_empty_and_negative():
+    with pytest.raises(ValueError):
+        parse_mix("write_can_frames=1")
+    with pytest.raises(ValueError):
+        parse_mix("monitor_signal=0")
+    with pytest.raises(ValueError):
+        parse_mix("read_can_frames=-5,decode_can_frame=10")
@@ -0,0 +1,17 @@
+import io
+import json
+
+from mcp_can.ndjson import NdjsonWriter
+
+
+def test_ndjson_writer_batches_until_threshold_or_flush():
+    stream = io.StringIO()
+    writer = NdjsonWriter(stream, flush_interval=3600, buffer_lines=3)
+    writer.write({"a": 1})
+    writer.write({"b": [1, 2]})
+    assert stream.getvalue() == ""
+    writer.write({"c": None})
+    assert stream.getvalue().splitlines() == ['{"a":1}', '{"b":[1,2]}', '{"c":null}']
+    writer.write({"d": object()})  # non-JSON values fall back to str()
+    writer.flush()
+    assert json.loads(stream.getvalue().splitlines()[-1])["d"].startswith("<object")
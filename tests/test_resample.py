@@ -0,0 +1,89 @@
+import os
+import random
+
+import pytest
+
+from mcp_can.dbc import encode_frame, load_dbc
+from mcp_can.models import Frame
+from mcp_can.resample import SignalResampler, resample_frames, resolve_signals
+
+DBC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "vehicle.dbc"))
+
+
+def _feed(method: str) -> dict:
+    r = SignalResampler(["a"], start=0.0, interval_s=0.1, method=method)
+    r.add("a", 0.05, 10.0)
+    r.add("a", 0.25, 30.0)
+    return r.finish(0.4)
+
+
+def test_resampler_methods():
+    assert _feed("zoh")["a"] == [None, 10.0, 10.0, 30.0]
+    assert _feed("nearest")["a"] == [10.0, 10.0, 30.0, 30.0]
+    linear = _feed("linear")["a"]
+    assert linear[0] is None and linear[3] == 30.0
+    assert linear[1] == pytest.approx(15.0) and linear[2] == pytest.approx(25.0)
+    assert _feed("zoh")["timestamp"] == [0.0, 0.1, 0.2, 0.3]
+
+
+def test_resampler_drains_only_complete_rows():
+    r = SignalResampler(["fast", "slow"], start=0.0, interval_s=0.05)
+    for i in range(6):
+        r.add("fast", i * 0.05, float(i))
+    r.add("slow", 0.0, 100.0)
+    r.add("slow", 0.1, 200.0)
+    partial = r.drain()
+    assert partial["timestamp"] == [0.0, 0.05]
+    assert partial["slow"] == [100.0, 100.0]
+    rest = r.finish(0.3)
+    assert rest["fast"] == [2.0, 3.0, 4.0, 5.0]
+    assert rest["slow"] == [200.0] * 4
+
+
+def test_resolve_signals_qualified_and_ambiguous():
+    db = load_dbc(DBC_PATH)
+    assert resolve_signals(db, ["ENGINE_SPEED"]) == {0x100: [("ENGINE_SPEED", "ENGINE_SPEED")]}
+    with pytest.raises(ValueError, match="ambiguous"):
+        resolve_signals(db, ["SERVICE_ID"])
+    index = resolve_signals(db, ["DIAGNOSTIC_REQUEST.SERVICE_ID"])
+    assert list(index) == [0x417]
+    with pytest.raises(ValueError):
+        resolve_signals(db, ["NOPE"])
+
+
+def test_resample_frames_aligns_signals_from_different_messages():
+    db = load_dbc(DBC_PATH)
+    frames = []
+    for i in range(4):  # ENGINE_STATUS every 50 ms, ABS_STATUS every 100 ms
+        _, data = encode_frame(db, "ENGINE_STATUS", {"ENGINE_SPEED": 1000 + i})
+        frames.append(Frame(timestamp=i * 0.05, arbitration_id=0x100, data=data))
+        if i % 2 == 0:
+            _, data = encode_frame(db, "ABS_STATUS", {"WHEEL_SPEED_FL": 10 + i})
+            frames.append(Frame(timestamp=i * 0.05 + 0.01, arbitration_id=0x200, data=data))
+    table = resample_frames(
+        db, frames, ["ENGINE_SPEED", "WHEEL_SPEED_FL"], 0.0, 0.2, 0.05, method="zoh"
+    )
+    assert table["ENGINE_SPEED"] == [1000, 1001, 1002, 1003]
+    assert table["WHEEL_SPEED_FL"] == [None, 10, 10, 12]
+
+
+def test_resample_frames_rejects_oversized_grid_before_reading():
+    db = load_dbc(DBC_PATH)
+
+    def frames():
+        raise AssertionError("frames must not be read")
+        yield
+
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        resample_frames(db, frames(), ["ENGINE_SPEED"], 0.0, 3600.0, 0.001)
+
+
+def test_resample_frames_grid_excludes_end_with_epoch_starts():
+    db = load_dbc(DBC_PATH)
+    rng = random.Random(7)
+    for _ in range(200):
+        start = 1_792_378_812.0 + rng.random() * 1000.0
+        end = start + 0.2
+        table = resample_frames(db, [], ["ENGINE_SPEED"], start, end, 0.05)
+        assert len(table["timestamp"]) == 4
+        assert table["timestamp"][-1] < end
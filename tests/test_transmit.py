@@ -0,0 +1,103 @@
+import os
+import time
+
+import can
+import pytest
+
+from mcp_can.dbc import decode_frame, encode_frame, load_dbc
+from mcp_can.transmit import PeriodicTransmitter, send_batch
+
+DBC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "vehicle.dbc"))
+
+
+def _drain(bus: can.BusABC, duration_s: float) -> list:
+    out = []
+    end = time.time() + duration_s
+    while time.time() < end:
+        msg = bus.recv(timeout=0.02)
+        if msg is not None:
+            out.append(msg)
+    return out
+
+
+def test_encode_frame_fills_missing_signals_and_rejects_unknown():
+    db = load_dbc(DBC_PATH)
+    message, data = encode_frame(db, "0x100", {"ENGINE_SPEED": 1500})
+    assert message.name == "ENGINE_STATUS"
+    decoded = decode_frame(db, message.frame_id, data)
+    assert decoded["ENGINE_SPEED"] == 1500
+    assert decoded["ENGINE_TEMP"] == -40  # raw zero
+    with pytest.raises(ValueError):
+        encode_frame(db, "ENGINE_STATUS", {"NOT_A_SIGNAL": 1})
+
+
+def test_send_batch_transmits_in_order():
+    db = load_dbc(DBC_PATH)
+    tx = can.Bus(interface="virtual", channel="test-transmit-batch")
+    rx = can.Bus(interface="virtual", channel="test-transmit-batch")
+    try:
+        send_batch(
+            tx,
+            db,
+            [
+                {"message": "ENGINE_STATUS", "signals": {"ENGINE_SPEED": 900}},
+                {"message": "BODY_STATUS", "signals": {"WIPER_STATUS": "LOW_SPEED"}},
+            ],
+        )
+        received = _drain(rx, 0.1)
+        assert [m.arbitration_id for m in received] == [0x100, 0x400]
+        assert str(decode_frame(db, 0x400, received[1].data)["WIPER_STATUS"]) == "LOW_SPEED"
+        with pytest.raises(ValueError, match=r"frames\[1\].*message"):
+            send_batch(tx, db, [{"message": "ENGINE_STATUS"}, {"signals": {}}])
+        with pytest.raises(ValueError, match="Unknown message 'NOPE'"):
+            send_batch(tx, db, [{"message": "NOPE"}])
+        assert _drain(rx, 0.05) == []
+    finally:
+        tx.shutdown()
+        rx.shutdown()
+
+
+def test_periodic_transmission_start_modify_stop():
+    db = load_dbc(DBC_PATH)
+    tx = can.Bus(interface="virtual", channel="test-transmit-periodic")
+    rx = can.Bus(interface="virtual", channel="test-transmit-periodic")
+    transmitter = PeriodicTransmitter(tx, db)
+    try:
+        entry = transmitter.start("ENGINE_STATUS", {"ENGINE_SPEED": 1000}, period_s=0.01)
+        assert len(_drain(rx, 0.2)) >= 5
+
+        transmitter.modify(entry.task_id, {"ENGINE_SPEED": 2000})
+        _drain(rx, 0.05)
+        latest = _drain(rx, 0.05)[-1]
+        assert decode_frame(db, 0x100, latest.data)["ENGINE_SPEED"] == 2000
+
+        transmitter.stop(entry.task_id)
+        assert not entry.active
+        assert transmitter.tasks() == []
+        _drain(rx, 0.05)
+        assert _drain(rx, 0.1) == []
+        with pytest.raises(ValueError):
+            transmitter.stop(entry.task_id)
+    finally:
+        transmitter.close()
+        tx.shutdown()
+        rx.shutdown()
+
+
+def test_periodic_transmitter_prunes_expired_tasks_and_drains_its_bus():
+    db = load_dbc(DBC_PATH)
+    tx = can.Bus(interface="virtual", channel="test-transmit-prune")
+    other = can.Bus(interface="virtual", channel="test-transmit-prune")
+    transmitter = PeriodicTransmitter(tx, db)
+    try:
+        transmitter.start("ENGINE_STATUS", {}, period_s=0.01, duration_s=0.05)
+        running = transmitter.start("BODY_STATUS", {}, period_s=0.01)
+        for _ in range(100):
+            other.send(can.Message(arbitration_id=0x200, data=bytes(8)))
+        time.sleep(0.3)
+        assert [e.task_id for e in transmitter.tasks()] == [running.task_id]
+        assert tx.queue.empty()
+    finally:
+        transmitter.close()
+        tx.shutdown()
+        other.shutdown()